@@ -0,0 +1,99 @@
+#! /usr/bin/env python3
+
+"""Benchmark of memory of import kept as list of citizen objects vs
+`gift_server.ImportArrays` & of time of its encoding (without database)"""
+
+import os, sys, random, datetime, tracemalloc
+from time import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.path.pardir))
+import gift_server
+
+SIZES = (10000, 100000)
+
+def make_import(n, rnd):
+    """Citizens (tuples of `CITIZEN_FIELDS`) & symmetric relations"""
+    citizens = []
+    for i in range(n):
+        citizens.append((i, f'Town {rnd.randrange(100)}',
+                         f'Street {rnd.randrange(1000)}',
+                         str(rnd.randrange(100)), rnd.randrange(1, 1000),
+                         f'Name {rnd.randrange(n)}',
+                         datetime.date(rnd.randint(1920, 2018),
+                                       rnd.randint(1, 12),
+                                       rnd.randint(1, 28)),
+                         rnd.choice(('male', 'female'))))
+    relations = set()
+    for _ in range(n):
+        x, y = rnd.randrange(n), rnd.randrange(n)
+        relations.add((x, y))
+        relations.add((y, x))
+    return citizens, sorted(relations)
+
+def citizen_objects(citizens, relations):
+    """List of citizen objects (like `citizens_python`)"""
+    rels = {}
+    for x, y in relations:
+        rels.setdefault(x, []).append(y)
+    citizens_obj_list = []
+    for citizen in citizens:
+        citizen_obj = dict(zip(gift_server.CITIZEN_FIELDS, citizen))
+        citizen_obj['birth_date'] = gift_server.format_date(
+            citizen_obj['birth_date'])
+        citizen_obj['relatives'] = rels.get(citizen[0], [])
+        citizens_obj_list.append(citizen_obj)
+    return citizens_obj_list
+
+def import_arrays(body):
+    """`ImportArrays` of encoded citizen objects"""
+    citizens = []
+    relations = []
+    for citizen_obj in gift_server.json_loads(body)['data']:
+        citizen_obj['birth_date'] = gift_server.parse_date(
+            citizen_obj['birth_date'])
+        citizens.append(tuple(citizen_obj[f]
+                              for f in gift_server.CITIZEN_FIELDS))
+        relations.extend((citizen_obj['citizen_id'], y)
+                         for y in citizen_obj['relatives'])
+    return gift_server.ImportArrays(citizens, relations)
+
+def measure(build, *args):
+    """Object built by `build(*args)`, its size in memory (objects, that
+    are referenced by it, are built from scratch) & build time"""
+    tracemalloc.start()
+    t = time()
+    obj = build(*args)
+    t = time() - t
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size, t
+
+def bench(n):
+    gift_server.set_json_codec('auto')
+    body = gift_server.json_dumps(
+        {'data': citizen_objects(*make_import(n, random.Random(n)))})
+
+    objects, objects_size, _ = measure(gift_server.json_loads, body)
+    t = time()
+    gift_server.json_dumps(objects)
+    objects_time = time() - t
+
+    arrays, arrays_size, _ = measure(import_arrays, body)
+    t = time()
+    arrays_body = arrays.encode()
+    arrays_time = time() - t
+    assert gift_server.json_loads(arrays_body) == objects
+
+    print('{} citizens: objects {} MB (encode {} sec), arrays {} MB '
+          '(encode {} sec), {}x less'.format(
+              n, round(objects_size/2**20, 1), round(objects_time, 3),
+              round(arrays_size/2**20, 1), round(arrays_time, 3),
+              round(objects_size/arrays_size, 1)))
+
+def main():
+    for n in SIZES:
+        bench(n)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#! /usr/bin/env python3
+
+"""Benchmark of latency of small requests to running server while big
+imports are posted (compare server options, e.g. `--offload`)"""
+
+import sys, json, random, asyncio, aiohttp
+from time import time
+
+SERV_ADDR = 'http://0.0.0.0:8080/imports'
+BIG_IMPORT_SIZE = 40000
+BIG_IMPORTS = 3
+SMALL_PERIOD = 0.005
+
+def make_import(n, rnd):
+    """Import with `n` citizens in pairs of relatives"""
+    citizens = []
+    for i in range(n):
+        citizens.append({
+            'citizen_id': i, 'town': f'Town {rnd.randrange(100)}',
+            'street': 'Street', 'building': '1', 'apartment': 1,
+            'name': 'Name', 'gender': rnd.choice(('male', 'female')),
+            'relatives': [i ^ 1] if (i ^ 1) < n else [],
+            'birth_date': '{:02}.{:02}.{}'.format(
+                rnd.randint(1, 28), rnd.randint(1, 12),
+                rnd.randint(1920, 2018))})
+    return json.dumps({'citizens': citizens}).encode()
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values)*p/100))]
+
+async def small_requests(session, url, done, latencies):
+    while not done.is_set():
+        t = time()
+        async with session.get(url) as r:
+            assert r.status == 200
+            await r.read()
+        latencies.append(time() - t)
+        await asyncio.sleep(SMALL_PERIOD)
+
+async def big_imports(session, body, done):
+    t = time()
+    for _ in range(BIG_IMPORTS):
+        async with session.post(
+                SERV_ADDR, data=body,
+                headers={'Content-Type': 'application/json'}) as r:
+            assert r.status == 201
+    done.set()
+    return time() - t
+
+async def main():
+    body = make_import(BIG_IMPORT_SIZE, random.Random(0))
+    async with aiohttp.ClientSession() as session:
+        async with session.post(SERV_ADDR,
+                                data=make_import(10, random.Random(1)),
+                                headers={'Content-Type':
+                                         'application/json'}) as r:
+            import_id = (await r.json())['data']['import_id']
+        url = f'{SERV_ADDR}/{import_id}/citizens/birthdays'
+
+        # latency without load
+        idle = []
+        done = asyncio.Event()
+        task = asyncio.ensure_future(
+            small_requests(session, url, done, idle))
+        await asyncio.sleep(1)
+        done.set()
+        await task
+
+        # latency while big imports are posted
+        loaded = []
+        done = asyncio.Event()
+        task = asyncio.ensure_future(
+            small_requests(session, url, done, loaded))
+        big_time = await big_imports(session, body, done)
+        await task
+
+    print('{} imports of {} bytes: {} sec'.format(
+        BIG_IMPORTS, len(body), round(big_time, 3)))
+    for name, latencies in (('idle', idle), ('loaded', loaded)):
+        print('{}: {} requests, p50 {} ms, p99 {} ms, max {} ms'.format(
+            name, len(latencies),
+            round(percentile(latencies, 50)*1000, 1),
+            round(percentile(latencies, 99)*1000, 1),
+            round(max(latencies)*1000, 1)))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+#! /usr/bin/env python3
+
+"""Benchmark of layouts of relations (see `gift_server.RELATIONS_LAYOUTS`):
+reading of citizens with relatives, relatives of one citizen & calculation
+of presents (imports are written & rolled back in one transaction, so
+database isn't changed)"""
+
+import os, sys, random, asyncio, datetime
+from time import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.path.pardir))
+import gift_server
+
+SIZES = (10000, 100000)
+RUNS = 5
+
+async def agen(items):
+    for item in items:
+        yield item
+
+def make_import(n, rnd):
+    """Citizens (tuples of `CITIZEN_FIELDS`) & symmetric relations"""
+    citizens = []
+    for i in range(n):
+        citizens.append((i, f'Town {rnd.randrange(100)}', 'Street', '1', 1,
+                         'Name', datetime.date(rnd.randint(1920, 2018),
+                                               rnd.randint(1, 12),
+                                               rnd.randint(1, 28)),
+                         rnd.choice(('male', 'female'))))
+    relations = set()
+    for _ in range(n):
+        x, y = rnd.randrange(n), rnd.randrange(n)
+        relations.add((x, y))
+        relations.add((y, x))
+    return citizens, relations
+
+async def best_time(f, *args):
+    times = []
+    for _ in range(RUNS):
+        t = time()
+        await f(*args)
+        times.append(time() - t)
+    return min(times)
+
+async def relatives_of(import_id, citizen_ids):
+    pairs = gift_server.relation_pairs(import_id)
+    for citizen_id in citizen_ids:
+        await gift_server.db.select([pairs.c.x]).where(
+            pairs.c.y == citizen_id).gino.all()
+
+async def bench(n, layout):
+    citizens, relations = make_import(n, random.Random(n))
+    gift_server.relations_layout = layout
+    async with gift_server.db.transaction() as tx:
+        import_id = await gift_server.create_unique_id()
+        conn = tx.connection.raw_connection
+        if layout == 'array':
+            relatives = {c[0]: [] for c in citizens}
+            for x, y in relations:
+                relatives[x].append(y)
+            await gift_server.copy_citizens(
+                conn, import_id,
+                agen(c + (relatives[c[0]],) for c in citizens),
+                gift_server.CITIZEN_FIELDS + ('relatives',))
+        else:
+            await gift_server.copy_citizens(conn, import_id, agen(citizens))
+            await gift_server.copy_relations(
+                conn, import_id, gift_server.stored_pairs(relations))
+        await gift_server.db.status('ANALYZE citizens')
+        await gift_server.db.status('ANALYZE relations')
+
+        results = [
+            await best_time(gift_server.citizens_sql, import_id),
+            await best_time(gift_server.citizens_python, import_id),
+            await best_time(relatives_of, import_id, range(0, n, n//100)),
+            await best_time(gift_server.fill_birthday_presents, import_id)]
+        tx.raise_rollback()
+    print('{} citizens, {}: sql {} sec, python {} sec, 100 citizens {} sec, '
+          'presents {} sec'.format(n, layout,
+                                   *(round(t, 3) for t in results)))
+
+async def main():
+    gift_server.db_password = os.environ.get('GIFT_DB_PASSWORD', 'Qwerty?0')
+    await gift_server.connect_db()
+    try:
+        for n in SIZES:
+            for layout in gift_server.RELATIONS_LAYOUTS:
+                await bench(n, layout)
+    finally:
+        await gift_server.db.pop_bind().close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
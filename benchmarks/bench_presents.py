@@ -0,0 +1,72 @@
+#! /usr/bin/env python3
+
+"""Benchmark of counting of presents by months: loop over relations in
+Python vs `gift_server.count_presents` (without database)"""
+
+import os, sys, random
+from time import time
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.path.pardir))
+import gift_server
+
+SIZES = ((100000, 1000000), (500000, 1000000))
+RUNS = 5
+
+def count_presents_loop(id_to_info):
+    """{citizen_id: {'month': month of birth, 'rels': relatives}} ->
+    response data (the previous implementation)"""
+    months_dist = [dict() for _ in range(13)]
+    for i, obj in id_to_info.items():
+        present_cnt = months_dist[obj['month']]
+        for donator in obj['rels']:
+            present_cnt[donator] = present_cnt.get(donator, 0) + 1
+    return {str(month): [{'citizen_id': donator, 'presents': cnt}
+                         for donator, cnt in months_dist[month].items()]
+            for month in range(1, 13)}
+
+def best_time(f, *args):
+    times = []
+    for _ in range(RUNS):
+        t = time()
+        result = f(*args)
+        times.append(time() - t)
+    return min(times), result
+
+def bench(n, relations):
+    rnd = numpy.random.default_rng(n)
+    ids = rnd.permutation(n * 2)[:n]
+    months = rnd.integers(1, 13, n)
+    xs = rnd.integers(0, n, relations // 2)
+    ys = rnd.integers(0, n, relations // 2)
+    x_rows = numpy.concatenate((xs, ys))
+    y_rows = numpy.concatenate((ys, xs))
+
+    id_to_info = {i: {'month': month, 'rels': []}
+                  for i, month in zip(ids.tolist(), months.tolist())}
+    ids_list = ids.tolist()
+    for x, y in zip(x_rows.tolist(), y_rows.tolist()):
+        id_to_info[ids_list[x]]['rels'].append(ids_list[y])
+
+    loop_time, loop_result = best_time(count_presents_loop, id_to_info)
+    numpy_time, numpy_result = best_time(
+        gift_server.count_presents, ids, months, x_rows, y_rows)
+    count_time, _ = best_time(
+        lambda: numpy.unique(months[x_rows] * n + y_rows,
+                             return_counts=True))
+    for month, donators in loop_result.items():
+        key = lambda obj: obj['citizen_id']
+        assert sorted(donators, key=key) == \
+            sorted(numpy_result[month], key=key)
+    print('{} citizens, {} relations: loop {} sec, numpy {} sec '
+          '(counting {} sec)'.format(n, relations, round(loop_time, 3),
+                                     round(numpy_time, 3),
+                                     round(count_time, 3)))
+
+def main():
+    for n, relations in SIZES:
+        bench(n, relations)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#! /usr/bin/env python3
+
+"""Benchmark of reading of citizens with relatives: merge of relations by
+Python vs aggregation by Postgres (imports are written & rolled back in
+one transaction, so database isn't changed)"""
+
+import os, sys, random, asyncio, datetime
+from time import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.path.pardir))
+import gift_server
+
+SIZES = (10000, 100000)
+RUNS = 5
+
+async def agen(items):
+    for item in items:
+        yield item
+
+def make_import(n, rnd):
+    """Citizens (tuples of `CITIZEN_FIELDS`) & symmetric relations"""
+    citizens = []
+    for i in range(n):
+        citizens.append((i, f'Town {rnd.randrange(100)}', 'Street', '1', 1,
+                         'Name', datetime.date(rnd.randint(1920, 2018),
+                                               rnd.randint(1, 12),
+                                               rnd.randint(1, 28)),
+                         rnd.choice(('male', 'female'))))
+    relations = set()
+    for _ in range(n):
+        x, y = rnd.randrange(n), rnd.randrange(n)
+        relations.add((x, y))
+        relations.add((y, x))
+    return citizens, relations
+
+async def bench(n):
+    citizens, relations = make_import(n, random.Random(n))
+    async with gift_server.db.transaction() as tx:
+        import_id = await gift_server.create_unique_id()
+        conn = tx.connection.raw_connection
+        await gift_server.copy_citizens(conn, import_id, agen(citizens))
+        await gift_server.copy_relations(conn, import_id, relations)
+        await gift_server.db.status('ANALYZE citizens')
+        await gift_server.db.status('ANALYZE relations')
+
+        results = {}
+        for read_f in (gift_server.citizens_python, gift_server.citizens_sql):
+            times = []
+            for _ in range(RUNS):
+                t = time()
+                citizens_obj_list = await read_f(import_id)
+                times.append(time() - t)
+            results[read_f.__name__] = min(times), citizens_obj_list
+        tx.raise_rollback()
+
+    python_list = results['citizens_python'][1]
+    sql_list = results['citizens_sql'][1]
+    key = lambda c: c['citizen_id']
+    for a, b in zip(sorted(python_list, key=key), sorted(sql_list, key=key)):
+        assert sorted(a.pop('relatives')) == sorted(b.pop('relatives'))
+        assert a == b
+    print('{} citizens: python {} sec, sql {} sec'.format(
+        n, round(results['citizens_python'][0], 3),
+        round(results['citizens_sql'][0], 3)))
+
+async def main():
+    gift_server.db_password = os.environ.get('GIFT_DB_PASSWORD', 'Qwerty?0')
+    await gift_server.connect_db()
+    try:
+        for n in SIZES:
+            await bench(n)
+    finally:
+        await gift_server.db.pop_bind().close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
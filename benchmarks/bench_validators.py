@@ -0,0 +1,61 @@
+#! /usr/bin/env python3
+
+"""Benchmark of checks of /imports POST-request citizens: per-citizen
+validator vs column-wise batches (without database)"""
+
+import os, sys, json
+from time import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.path.pardir))
+import gift_server
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), os.path.pardir, 'tests',
+                         'data', 'post_sequential', 'writers_orig.json')
+COPIES = 500
+RUNS = 5
+
+def make_import():
+    """Citizens of test import repeated `COPIES` times with shifted ids"""
+    with open(DATA_PATH) as f:
+        citizens = json.load(f)['citizens']
+    n = len(citizens)
+    big_import = []
+    for i in range(COPIES):
+        for citizen_obj in citizens:
+            citizen_obj = dict(citizen_obj)
+            citizen_obj['citizen_id'] += n*i
+            citizen_obj['relatives'] = [j + n*i
+                                        for j in citizen_obj['relatives']]
+            big_import.append(citizen_obj)
+    return big_import
+
+def check_rows(citizens):
+    rel_check_str = gift_server.CheckRelsStruct()
+    for citizen_obj in citizens:
+        gift_server.check_citizen_data(citizen_obj, rel_check_str, True)
+    gift_server.check_relations(rel_check_str)
+
+def check_batches(citizens):
+    rel_check_str = gift_server.CheckRelsStruct()
+    for i in range(0, len(citizens), gift_server.VALIDATOR_BATCH):
+        gift_server.check_citizens_batch(
+            citizens[i:i + gift_server.VALIDATOR_BATCH], rel_check_str)
+    gift_server.check_relations(rel_check_str)
+
+def best_time(f, *args):
+    times = []
+    for _ in range(RUNS):
+        t = time()
+        f(*args)
+        times.append(time() - t)
+    return min(times)
+
+def main():
+    citizens = make_import()
+    print('{} citizens: rows {} sec, batch {} sec'.format(
+        len(citizens), round(best_time(check_rows, citizens), 3),
+        round(best_time(check_batches, citizens), 3)))
+
+
+if __name__ == '__main__':
+    main()
@@ -49,6 +49,7 @@ def test_f():
     post400(s, serv_addr, 'relatives', [4])
     post400(s, serv_addr, 'relatives', ['lizard'])
     post400(s, serv_addr, 'relatives', [-1])
+    post400(s, serv_addr, 'relatives', [1, 1])
 
     post400(s, serv_addr, 'birth_date', None)
     post400(s, serv_addr, 'birth_date', '')
@@ -88,6 +89,15 @@ def test_f():
     post400(s, serv_addr, 'apartment', -1)
     post400(s, serv_addr, 'apartment', '1')
 
+    # accepted date with sign or space is returned as 'DD.MM.YYYY'
+    for birth_date in (' 1.02.2000', '+3.02.2000'):
+        db_orig = json.load(open('data/error_status/post_correct.json'))
+        db_orig['citizens'][0]['birth_date'] = birth_date
+        r = s.post(f'{serv_addr}', json=db_orig)
+        assert r.status_code == 201
+        r = s.get(f"{serv_addr}/{r.json()['data']['import_id']}/citizens")
+        assert r.json()['data'][0]['birth_date'] == '0' + birth_date[1:]
+
 
     # POST correct
     db_orig = json.load(open('data/error_status/post_correct1.json'))
@@ -104,6 +114,7 @@ def test_f():
     patch400(s, serv_addr, import_id, 'relatives', [4])
     patch400(s, serv_addr, import_id, 'relatives', ['lizard'])
     patch400(s, serv_addr, import_id, 'relatives', [-1])
+    patch400(s, serv_addr, import_id, 'relatives', [1, 1])
 
     patch400(s, serv_addr, import_id, 'birth_date', None)
     patch400(s, serv_addr, import_id, 'birth_date', '')
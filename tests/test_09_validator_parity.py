@@ -0,0 +1,79 @@
+#! /usr/bin/env python3
+
+"""Testset of parity of per-citizen & batch validators (without server)"""
+
+import os, sys, json, copy
+
+sys.path.insert(0, os.path.pardir)
+import gift_server
+
+def check(check_f, citizens):
+    """Result of check: (error message or None, citizens, relatives)"""
+    citizens = copy.deepcopy(citizens)
+    rel_check_str = gift_server.CheckRelsStruct()
+    try:
+        check_f(citizens, rel_check_str)
+    except gift_server.IncorrectData as e:
+        return str(e), rel_check_str.citizens
+    rels = set(rel_check_str.relatives)
+    for xs, ys in rel_check_str.relatives_arrays:
+        rels.update(zip(xs.tolist(), ys.tolist()))
+    try:
+        gift_server.check_relations(rel_check_str)
+    except gift_server.IncorrectData as e:
+        return 'relations', rel_check_str.citizens, rels
+    return None, rel_check_str.citizens, rels
+
+def check_rows(citizens, rel_check_str):
+    for citizen_obj in citizens:
+        gift_server.check_citizen_data(citizen_obj, rel_check_str, True)
+
+def check_batch(citizens, rel_check_str):
+    gift_server.check_citizens_batch(citizens, rel_check_str)
+
+def test_f():
+
+    # correct imports
+    for fname in ('data/baseset/db_orig.json',
+                  'data/self_rel/post.json',
+                  'data/post_sequential/writers_orig.json'):
+        citizens = json.load(open(fname))['citizens']
+        res = check(check_rows, citizens)
+        assert res[0] is None
+        assert res == check(check_batch, citizens)
+
+    # incorrect values of fields (the same as in test_08)
+    citizens = json.load(open('data/error_status/post_correct.json'))
+    citizens = citizens['citizens']
+    values = {
+        'relatives': [None, '', [4], ['lizard'], [-1], [2, 2], [1, 1]],
+        'birth_date': [None, '', '.', '..', '1.01.2019', 13, '2019.01.01',
+                       '01.2019.01', ' 01.01.2019', '01.01.2019 ',
+                       '31.02.2000', '01.01.2999', '+1.01.2000',
+                       '١١.01.2000'],
+        'name': [None, '', ' ', '*'],
+        'town': [None, '', ' ~.*-/', ' ~.*-/7', '_', '½', '½a'],
+        'gender': [None, '', 'male', 'female'],
+        'building': [None, '', 15, '15', 'a'],
+        'apartment': [None, '', 0, -1, '1', True],
+        'citizen_id': [-1, 2, '1', 2**70],
+    }
+    for field, field_values in values.items():
+        for value in field_values:
+            for i in (0, len(citizens) - 1):
+                wrong = copy.deepcopy(citizens)
+                wrong[i][field] = value
+                assert check(check_rows, wrong) == check(check_batch, wrong)
+    for wrong in ([dict(citizens[0], extra=1)] + citizens,
+                  citizens + [{}], citizens + [[]], citizens + citizens):
+        assert check(check_rows, wrong) == check(check_batch, wrong)
+
+    # repeated relative to himself
+    wrong = [dict(citizens[0], relatives=[citizens[0]['citizen_id']] * 2)]
+    res = check(check_rows, wrong)
+    assert res[0] == 'Duplicated relation: (1, 1)'
+    assert res == check(check_batch, wrong)
+
+
+if __name__ == '__main__':
+    test_f()
@@ -0,0 +1,73 @@
+#! /usr/bin/env python3
+
+"""Testset of parity of percentiles calculated by NumPy, by Postgres &
+from precomputed histogram of birth dates"""
+
+import os, sys, json, random, asyncio, requests
+
+sys.path.insert(0, os.path.pardir)
+import gift_server
+
+def order_json(obj):
+    if isinstance(obj, dict):
+        return sorted((k, order_json(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return sorted(order_json(x) for x in obj)
+    else:
+        return obj
+
+def make_import(rnd):
+    """Import with towns of different sizes & random birth dates"""
+    citizens = []
+    for town_size in list(range(1, 12)) + [99, 100, 101, 1000]:
+        for _ in range(town_size):
+            citizens.append({
+                'citizen_id': len(citizens), 'town': f'Town {town_size}',
+                'street': 'Street', 'building': '1', 'apartment': 1,
+                'name': 'Name', 'gender': 'female', 'relatives': [],
+                'birth_date': '{:02}.{:02}.{}'.format(
+                    rnd.randint(1, 28), rnd.randint(1, 12),
+                    rnd.randint(1920, 2018))})
+    return {'citizens': citizens}
+
+async def calc_percentiles(import_id):
+    gift_server.db_password = 'Qwerty?0'
+    await gift_server.connect_db()
+    try:
+        return (await gift_server.agestat_numpy(import_id),
+                await gift_server.agestat_sql(import_id),
+                await gift_server.agestat_precomputed(import_id))
+    finally:
+        await gift_server.db.pop_bind().close()
+
+def test_f():
+
+    s = requests.Session()
+    serv_addr = 'http://0.0.0.0:8080/imports'
+
+    # percentiles are calculated from database (not from memory storage)
+    stats = s.get('http://0.0.0.0:8080/stats').json()['data']
+    if stats['storage'] != 'postgres':
+        return
+
+    # POST
+    r = s.post(f'{serv_addr}', json=make_import(random.Random(0)))
+    assert r.status_code == 201
+    import_id = r.json()['data']['import_id']
+
+    # compare percentiles
+    agestat_numpy, agestat_sql, agestat_precomputed = asyncio.run(
+        calc_percentiles(import_id))
+    assert len(agestat_numpy) == 15
+    assert order_json(agestat_numpy) == order_json(agestat_sql)
+    assert order_json(agestat_numpy) == order_json(agestat_precomputed)
+
+    # GET percentile
+    r = s.get(f'{serv_addr}/{import_id}/towns/stat/percentile/age')
+    assert r.status_code == 200
+    test_response = r.json()['data']
+    assert order_json(test_response) == order_json(agestat_numpy)
+
+
+if __name__ == '__main__':
+    test_f()
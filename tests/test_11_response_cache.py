@@ -0,0 +1,56 @@
+#! /usr/bin/env python3
+
+"""Testset of invalidation of cached responses & entity tags by
+PATCH-requests"""
+
+import json, requests
+
+def test_f():
+
+    s = requests.Session()
+    serv_addr = 'http://0.0.0.0:8080/imports'
+
+    # POST
+    with open('data/baseset/db_orig.json') as f:
+        r = s.post(f'{serv_addr}', json=json.load(f))
+    assert r.status_code == 201
+    import_id = r.json()['data']['import_id']
+
+    # repeated GETs return the same responses
+    urls = [f'{serv_addr}/{import_id}/citizens',
+            f'{serv_addr}/{import_id}/citizens/birthdays',
+            f'{serv_addr}/{import_id}/towns/stat/percentile/age']
+    stats = s.get('http://0.0.0.0:8080/stats').json()['data']
+    hits = stats['response_cache']['hits']
+    responses = [s.get(url).json() for url in urls]
+    assert responses == [s.get(url).json() for url in urls]
+    stats = s.get('http://0.0.0.0:8080/stats').json()['data']
+    if stats['response_cache']['max_size']:
+        # streamed citizens aren't cached
+        cached = len(urls) - (stats['citizens_response'] == 'stream')
+        assert stats['response_cache']['hits'] >= hits + cached
+
+    # unchanged import isn't sent again
+    etags = [s.get(url).headers['ETag'] for url in urls]
+    for url, etag in zip(urls, etags):
+        r = s.get(url, headers={'If-None-Match': etag})
+        assert r.status_code == 304 and r.headers['ETag'] == etag
+
+    # PATCH changes all responses & tags
+    citizen_id = responses[0]['data'][0]['citizen_id']
+    patch_obj = {'town': 'Другой город', 'birth_date': '01.01.1970',
+                 'relatives': []}
+    r = s.patch(f'{serv_addr}/{import_id}/citizens/{citizen_id}',
+                json=patch_obj)
+    assert r.status_code == 200
+    for url, response, etag in zip(urls, responses, etags):
+        r = s.get(url, headers={'If-None-Match': etag})
+        assert r.status_code == 200 and r.headers['ETag'] != etag
+        assert r.json() != response
+    citizen = next(c for c in s.get(urls[0]).json()['data']
+                   if c['citizen_id'] == citizen_id)
+    assert {k: citizen[k] for k in patch_obj} == patch_obj
+
+
+if __name__ == '__main__':
+    test_f()
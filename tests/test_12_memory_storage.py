@@ -0,0 +1,81 @@
+#! /usr/bin/env python3
+
+"""Testset of memory storage & replay of its log (without server)"""
+
+import os, sys, json, asyncio, tempfile
+
+sys.path.insert(0, os.path.pardir)
+import gift_server
+from helpers import store
+
+async def read(storage, import_id):
+    return (await storage.version(import_id),
+            json.loads(await storage.citizens(import_id)),
+            await storage.birthdays(import_id),
+            await storage.agestat(import_id, None))
+
+async def run(log_path):
+    with open('data/baseset/db_orig.json') as f:
+        citizens = json.load(f)['citizens']
+
+    storage = gift_server.MemoryStorage(log_path)
+    await storage.open()
+    import_id = await store(storage, citizens)
+    try:
+        await store(storage, citizens + citizens[:1])
+        assert False
+    except gift_server.IncorrectData as e:
+        assert str(e).startswith('Duplicated citizen')
+    citizen_id = citizens[0]['citizen_id']
+    relatives = [c['citizen_id'] for c in citizens[1:3]]
+    citizen_obj = await storage.alter_citizen(
+        import_id, citizen_id,
+        {'birth_date': gift_server.parse_date('01.01.1970'),
+         'relatives': relatives})
+    assert citizen_obj['birth_date'] == '01.01.1970'
+    assert citizen_obj['relatives'] == relatives
+    for wrong_ids in ((import_id + 1, citizen_id),
+                      (import_id, citizen_id + 1000)):
+        try:
+            await storage.alter_citizen(*wrong_ids, {})
+            assert False
+        except gift_server.NotFound:
+            pass
+    data = await read(storage, import_id)
+    await storage.close()
+
+    # relatives are symmetric
+    rels = {c['citizen_id']: c['relatives'] for c in data[1]['data']}
+    for x, ys in rels.items():
+        assert all(x in rels[y] for y in ys)
+
+    # the same data after replay of log
+    storage = gift_server.MemoryStorage(log_path)
+    await storage.open()
+    assert await read(storage, import_id) == data
+    assert await storage.version(import_id + 1) is None
+    await storage.close()
+
+    # without log ids of imports are reused after restart, but entity tags
+    # of responses are not
+    etags = set()
+    saved = gift_server.storage
+    try:
+        for _ in range(2):
+            storage = gift_server.storage = gift_server.MemoryStorage()
+            await storage.open()
+            import_id = await store(storage, citizens)
+            etags.add(gift_server.import_etag(
+                import_id, await storage.version(import_id)))
+            await storage.close()
+    finally:
+        gift_server.storage = saved
+    assert len(etags) == 2
+
+def test_f():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        asyncio.run(run(os.path.join(tmp_dir, 'imports.log')))
+
+
+if __name__ == '__main__':
+    test_f()
@@ -0,0 +1,80 @@
+#! /usr/bin/env python3
+
+"""Testset of imports in tables partitioned by imports: conversion of
+flat tables, writing & dropping of imports (without server, in temporary
+schema of database)"""
+
+import os, sys, json, asyncio
+
+sys.path.insert(0, os.path.pardir)
+import gift_server
+from helpers import store, bind_schema, run_in_schema
+
+SCHEMA = 'test_partitions'
+
+async def read(storage, import_id):
+    return (json.loads(await storage.citizens(import_id)),
+            await storage.birthdays(import_id),
+            await storage.agestat(import_id, None))
+
+async def attached(import_id):
+    """Names of attached partitions of import"""
+    names = []
+    for name in gift_server.partition_names(import_id):
+        if await gift_server.db.scalar(
+                'SELECT count(*) FROM pg_inherits '
+                'WHERE inhrelid = to_regclass($1)', name):
+            names.append(name)
+    return names
+
+async def run(conn):
+    with open('data/baseset/db_orig.json') as f:
+        citizens = json.load(f)['citizens']
+
+    storage = gift_server.PostgresStorage()
+    await storage.open()
+    assert not gift_server.partitioned
+    flat_id = await store(storage, citizens)
+    data = await read(storage, flat_id)
+    await storage.close()
+
+    # conversion of flat tables (offline) & restart
+    await bind_schema(SCHEMA)
+    await gift_server.partition_tables()
+    await gift_server.db.pop_bind().close()
+    await storage.open()
+    assert gift_server.partitioned
+    assert await read(storage, flat_id) == data
+
+    # new import is written to its partitions
+    import_id = await store(storage, citizens)
+    assert await attached(import_id) == list(
+        gift_server.partition_names(import_id))
+    assert await read(storage, import_id) == data
+
+    # wrong import leaves no partitions
+    try:
+        await store(storage, citizens + citizens[:1])
+        assert False
+    except gift_server.IncorrectData:
+        pass
+    assert await gift_server.db.scalar(
+        'SELECT to_regclass($1)',
+        gift_server.partition_names(import_id + 1)[0]) is None
+
+    # dropped import (repeated drop does nothing), other one is intact
+    for _ in range(2):
+        await gift_server.drop_import(import_id)
+        assert await storage.version(import_id) is None
+        for name in gift_server.partition_names(import_id):
+            assert await gift_server.db.scalar(
+                'SELECT to_regclass($1)', name) is None
+    assert await read(storage, flat_id) == data
+    await storage.close()
+
+def test_f():
+    asyncio.run(run_in_schema(SCHEMA, run))
+
+
+if __name__ == '__main__':
+    test_f()
@@ -0,0 +1,71 @@
+#! /usr/bin/env python3
+
+"""Testset of parity of incremental parser of /imports POST-request body
+& `json.loads` (without server)"""
+
+import os, sys, json, asyncio
+
+sys.path.insert(0, os.path.pardir)
+import gift_server
+
+CHUNK_SIZES = (1, 2, 7, 1000, gift_server.STREAM_CHUNK_SIZE)
+
+class Content():
+    """Body of request read like aiohttp `StreamReader`"""
+    def __init__(self, body):
+        self.body = body
+        self.pos = 0
+    async def read(self, n):
+        chunk = self.body[self.pos:self.pos + n]
+        self.pos += len(chunk)
+        return chunk
+
+async def parse(body, chunk_size, max_size=None):
+    """Citizens of body parsed by `CitizensStream` or `IncorrectJSON`"""
+    stream = gift_server.CitizensStream(
+        Content(body), len(body) if max_size is None else max_size,
+        chunk_size)
+    try:
+        return [citizen_obj async for citizen_obj in stream]
+    except gift_server.IncorrectJSON as e:
+        return e
+
+def test_f():
+
+    # correct bodies in different formatting
+    bodies = []
+    for fname in ('data/baseset/db_orig.json', 'data/self_rel/post.json',
+                  'data/post_sequential/writers_orig.json'):
+        with open(fname) as f:
+            post_obj = json.load(f)
+        bodies += [json.dumps(post_obj).encode(),
+                   json.dumps(post_obj, indent=2).encode(),
+                   json.dumps(post_obj, separators=(',', ':'),
+                              ensure_ascii=False).encode(),
+                   json.dumps(dict(before=[{'citizens': 1}], **post_obj,
+                                   after='}')).encode()]
+    bodies += [b'{"citizens": []}', b' { "citizens" : [ ] } ',
+               b'{"citizens": [{"a": [1, 2.5e3, -7, null, true]}]}',
+               '{"citizens": [{"name": "Имя \\"\\u0418\\""}]}'.encode()]
+    for body in bodies:
+        citizens = json.loads(body)['citizens']
+        for chunk_size in CHUNK_SIZES:
+            assert asyncio.run(parse(body, chunk_size)) == citizens
+
+    # incorrect bodies (not JSON or without citizens)
+    for body in (b'', b'[]', b'{', b'{"citizens": [{}]', b'{"citizens": [,]}',
+                 b'{"citizens": [{}, ]}', b'{"citizens": [{}]} x',
+                 b'{"citizens": [{"a": 1}{"a": 2}]}', b'{1: []}',
+                 b'{"citizens": [{"a": 12', b'{"citizens": [{"a": tru}]}',
+                 b'{"citizens": ["\xff"]}', b'{"other": []}'):
+        for chunk_size in CHUNK_SIZES:
+            result = asyncio.run(parse(body, chunk_size))
+            assert isinstance(result, gift_server.IncorrectJSON), body
+
+    # body larger than limit
+    result = asyncio.run(parse(bodies[0], 1000, len(bodies[0]) - 1))
+    assert isinstance(result, gift_server.IncorrectJSON)
+
+
+if __name__ == '__main__':
+    test_f()
@@ -0,0 +1,84 @@
+#! /usr/bin/env python3
+
+"""Testset of migration of database written by the first version of
+server (dates as 'YYYY.MM.DD' strings, no keys): migrated imports are
+read the same as imports written anew (without server, in temporary
+schema of database)"""
+
+import os, sys, json, asyncio
+
+sys.path.insert(0, os.path.pardir)
+import gift_server
+from helpers import store, run_in_schema
+
+SCHEMA = 'test_migrations'
+
+# tables of the first version
+OLD_TABLES = (
+    'CREATE TABLE imports (id SERIAL PRIMARY KEY)',
+    'CREATE TABLE citizens (import_id INTEGER, citizen_id INTEGER, '
+    'town VARCHAR, street VARCHAR, building VARCHAR, apartment INTEGER, '
+    'name VARCHAR, birth_date VARCHAR, gender VARCHAR)',
+    'CREATE INDEX imps_import_id_idx ON citizens (import_id)',
+    'CREATE TABLE relations (import_id INTEGER, x INTEGER, y INTEGER)',
+    'CREATE INDEX rels_import_id_idx ON relations (import_id)')
+
+async def store_old(conn, citizens, repeated=()):
+    """Write import like the first version (relatives of `repeated`
+    citizens to themselves are written twice, as it accepted them)"""
+    import_id = await conn.fetchval(
+        'INSERT INTO imports DEFAULT VALUES RETURNING id')
+    await conn.executemany(
+        'INSERT INTO citizens VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)',
+        [(import_id, c['citizen_id'], c['town'], c['street'], c['building'],
+          c['apartment'], c['name'],
+          '.'.join(c['birth_date'].split('.')[::-1]), c['gender'])
+         for c in citizens])
+    relations = [(import_id, c['citizen_id'], y) for c in citizens
+                 for y in c['relatives']]
+    relations += [(import_id, x, x) for x in repeated]
+    await conn.executemany('INSERT INTO relations VALUES ($1, $2, $3)',
+                           relations)
+    return import_id
+
+async def read(storage, import_id):
+    return (json.loads(await storage.citizens(import_id)),
+            await storage.birthdays(import_id),
+            await storage.agestat(import_id, None))
+
+async def run(conn):
+    imports = []
+    for fname in ('data/baseset/db_orig.json', 'data/self_rel/post.json'):
+        with open(fname) as f:
+            imports.append(json.load(f)['citizens'])
+    self_rel = next(c['citizen_id'] for c in imports[1]
+                    if c['citizen_id'] in c['relatives'])
+
+    # database of the first version
+    for query in OLD_TABLES:
+        await conn.execute(query)
+    old_ids = [await store_old(conn, imports[0]),
+               await store_old(conn, imports[1], [self_rel])]
+
+    # migrated imports are the same as new ones
+    storage = gift_server.PostgresStorage()
+    await storage.open()
+    try:
+        assert await gift_server.db.scalar(
+            'SELECT max(version) FROM schema') == len(gift_server.MIGRATIONS)
+        for old_id, citizens in zip(old_ids, imports):
+            new_id = await store(storage, citizens)
+            assert await read(storage, old_id) == await read(storage, new_id)
+
+        # import with removed repeated relation is changed
+        assert await storage.version(old_ids[0]) == 0
+        assert await storage.version(old_ids[1]) == 1
+    finally:
+        await storage.close()
+
+def test_f():
+    asyncio.run(run_in_schema(SCHEMA, run))
+
+
+if __name__ == '__main__':
+    test_f()
@@ -0,0 +1,61 @@
+#! /usr/bin/env python3
+
+"""Testset of parity of relatives aggregated by Postgres (`--relatives
+sql`) & merged by Python (without server, in temporary schema of
+database)"""
+
+import os, sys, json, asyncio
+
+sys.path.insert(0, os.path.pardir)
+import gift_server
+from helpers import store, patch, order, run_in_schema
+
+SCHEMA = 'test_relatives_sql'
+
+async def check(import_id, citizens=None):
+    sql = order(await gift_server.citizens_sql(import_id))
+    assert sql == order(await gift_server.citizens_python(import_id))
+    if citizens is not None:
+        assert sql == order(citizens)
+
+async def run(conn):
+    imports = []
+    for fname in ('data/baseset/db_orig.json', 'data/self_rel/post.json',
+                  'data/post_sequential/writers_orig.json'):
+        with open(fname) as f:
+            imports.append(json.load(f)['citizens'])
+    # citizen without relatives only
+    imports.append([dict(imports[1][0], relatives=[])])
+
+    storage = gift_server.PostgresStorage()
+    await storage.open()
+    try:
+        import_ids = []
+        for citizens in imports:
+            import_ids.append(await store(storage, citizens))
+            await check(import_ids[-1], citizens)
+
+        # after changes of relatives (self relation too)
+        with open('data/baseset/patch_wedding.json') as f:
+            await patch(storage, import_ids[0], 3, json.load(f))
+        for fname in ('data/self_rel/patch_destruction.json',
+                      'data/self_rel/patch_reconstruction.json'):
+            with open(fname) as f:
+                await patch(storage, import_ids[1], 1000, json.load(f))
+            await check(import_ids[1])
+        await patch(storage, import_ids[3], 1000,
+                    {'relatives': [1000], 'birth_date': '01.02.2003'})
+        for import_id in import_ids:
+            await check(import_id)
+
+        # missing import
+        assert await gift_server.citizens_sql(import_ids[-1] + 1) == []
+    finally:
+        await storage.close()
+
+def test_f():
+    asyncio.run(run_in_schema(SCHEMA, run))
+
+
+if __name__ == '__main__':
+    test_f()
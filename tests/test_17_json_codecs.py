@@ -0,0 +1,55 @@
+#! /usr/bin/env python3
+
+"""Testset of parity of installed JSON codecs (`--json`) & stdlib `json`
+(without server)"""
+
+import os, sys, json
+import numpy
+
+sys.path.insert(0, os.path.pardir)
+import gift_server
+
+OBJECTS = (
+    {'data': []}, {'data': {'import_id': 1}},
+    {'citizen_id': 2**31 - 1, 'apartment': 0, 'relatives': [1, 2, 3],
+     'name': 'Имя "в кавычках" \\ \t\n\u0000\u001f  😀',
+     'town': '', 'birth_date': '01.02.2003', 'gender': 'female'},
+    {'data': [{'town': 'Москва', 'p50': numpy.float64(27.0),
+               'p75': numpy.float64(29.5), 'p99': 31.99}]},
+    {'a': [None, True, False, -1, 0.5, 1e-7, 1.5e300, [], {}]})
+
+INCORRECT = (b'', b'{', b'{"a": 1', b'{"a": 1,}', b'[1, 2,]', b"{'a': 1}",
+             b'{"a": tru}', b'{"a": 01}', b'{"a": "\xff"}', b'{1: 2}',
+             b'{"a": 1} x', b'{"a": "\x01"}')
+
+def test_f():
+    try:
+        for name in gift_server.JSON_CODECS:
+            assert gift_server.set_json_codec(name) == name
+
+            # encoded objects are decoded the same by stdlib & codec
+            for obj in OBJECTS:
+                body = gift_server.json_dumps(obj)
+                assert isinstance(body, bytes)
+                assert json.loads(body) == obj, name
+                assert gift_server.json_loads(body) == obj, name
+                assert gift_server.json_loads(json.dumps(obj).encode()) == \
+                    obj, name
+                assert gift_server.json_loads(
+                    json.dumps(obj, ensure_ascii=False).encode()) == obj, name
+
+            # incorrect bodies are rejected
+            for body in INCORRECT:
+                try:
+                    gift_server.json_loads(body)
+                    assert False, (name, body)
+                except ValueError:
+                    pass
+
+        assert gift_server.set_json_codec('auto') in gift_server.JSON_CODECS
+    finally:
+        gift_server.set_json_codec('stdlib')
+
+
+if __name__ == '__main__':
+    test_f()
@@ -0,0 +1,72 @@
+#! /usr/bin/env python3
+
+"""Testset of server in several processes (`--workers 2`, started by
+test on port 8081): requests are served by different workers with the
+same responses & changes are seen by all of them"""
+
+import os, sys, json, signal, subprocess, requests
+
+PORT = 8081
+REQUESTS = 50
+
+def get(url):
+    """Response of new connection (may be accepted by any worker)"""
+    r = requests.get(url, headers={'Connection': 'close'})
+    assert r.status_code == 200
+    return r.json()
+
+def start_server():
+    server = subprocess.Popen(
+        [sys.executable, 'gift_server.py', '--workers', '2',
+         '--port', str(PORT)],
+        cwd=os.path.pardir, stdout=subprocess.PIPE, text=True)
+    for line in server.stdout:
+        if 'Running on' in line:
+            return server
+    raise RuntimeError(f'server exited with code {server.wait()}')
+
+def test_f():
+
+    server = start_server()
+    try:
+        serv_addr = f'http://0.0.0.0:{PORT}/imports'
+
+        # requests are accepted by both workers
+        pids = {get(f'http://0.0.0.0:{PORT}/stats')['data']['pid']
+                for _ in range(REQUESTS)}
+        assert len(pids) == 2
+
+        # POST
+        with open('data/baseset/db_orig.json') as f:
+            r = requests.post(serv_addr, json=json.load(f))
+        assert r.status_code == 201
+        import_id = r.json()['data']['import_id']
+
+        # every worker returns the same responses (& caches them)
+        urls = [f'{serv_addr}/{import_id}/citizens',
+                f'{serv_addr}/{import_id}/citizens/birthdays',
+                f'{serv_addr}/{import_id}/towns/stat/percentile/age']
+        responses = [get(url) for url in urls]
+        for _ in range(REQUESTS // 10):
+            assert [get(url) for url in urls] == responses
+
+        # PATCH in one worker is seen by all of them
+        with open('data/baseset/patch_wedding.json') as f:
+            r = requests.patch(f'{serv_addr}/{import_id}/citizens/3',
+                               json=json.load(f))
+        assert r.status_code == 200
+        responses = [get(url) for url in urls]
+        citizen_obj = next(citizen_obj
+                           for citizen_obj in responses[0]['data']
+                           if citizen_obj['citizen_id'] == 3)
+        assert citizen_obj == r.json()['data']
+        for _ in range(REQUESTS // 10):
+            assert [get(url) for url in urls] == responses
+
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.communicate(timeout=30)
+
+
+if __name__ == '__main__':
+    test_f()
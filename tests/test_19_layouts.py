@@ -0,0 +1,139 @@
+#! /usr/bin/env python3
+
+"""Testset of layouts of relations (`--relations-layout`): imports are
+read the same after conversions between layouts & imports written or
+changed in every layout are the same as in symmetric one (without
+server, in temporary schema of database)"""
+
+import os, sys, json, asyncio
+
+sys.path.insert(0, os.path.pardir)
+import gift_server
+from helpers import store, patch, order, bind_schema, run_in_schema
+
+SCHEMA = 'test_layouts'
+
+# layouts converted to in turn (from symmetric one)
+LAYOUTS = ('compact', 'array', 'symmetric', 'array', 'compact',
+           'symmetric')
+
+async def read(storage, import_id):
+    citizens = order(json.loads(await storage.citizens(import_id))['data'])
+    assert order(await gift_server.citizens_sql(import_id)) == citizens
+    return (citizens, await storage.birthdays(import_id),
+            await storage.agestat(import_id, None))
+
+async def check_rows(layout):
+    """Rows of relations & arrays of relatives are stored as `layout`
+    requires"""
+    arrays = await gift_server.db.scalar(
+        'SELECT count(relatives) FROM citizens')
+    if layout == 'array':
+        assert arrays == await gift_server.db.scalar(
+            'SELECT count(*) FROM citizens')
+        assert not await gift_server.db.scalar(
+            'SELECT count(*) FROM relations')
+        return
+    assert not arrays
+    if layout == 'compact':
+        assert not await gift_server.db.scalar(
+            'SELECT count(*) FROM relations WHERE x > y')
+    if layout == 'symmetric':
+        assert not await gift_server.db.scalar(
+            'SELECT count(*) FROM relations a WHERE NOT EXISTS ('
+            'SELECT 1 FROM relations b WHERE a.import_id = b.import_id '
+            'AND a.x = b.y AND a.y = b.x)')
+
+async def convert(layout):
+    """Offline conversion of relations (like `--relations-layout`)"""
+    await bind_schema(SCHEMA)
+    await gift_server.set_relations_layout(layout)
+    await gift_server.db.pop_bind().close()
+
+async def change(storage, i, import_id):
+    """Change relatives in import of `i`-th test file"""
+    if i == 0:
+        with open('data/baseset/patch_wedding.json') as f:
+            await patch(storage, import_id, 3, json.load(f))
+    else:
+        for fname in ('data/self_rel/patch_destruction.json',
+                      'data/self_rel/patch_reconstruction.json',
+                      'data/self_rel/patch_destruction.json'):
+            with open(fname) as f:
+                await patch(storage, import_id, 1000, json.load(f))
+
+async def run(conn):
+    imports = []
+    for fname in ('data/baseset/db_orig.json', 'data/self_rel/post.json',
+                  'data/post_sequential/writers_orig.json'):
+        with open(fname) as f:
+            imports.append(json.load(f)['citizens'])
+
+    # imports in symmetric layout: data of imports & changed ones
+    storage = gift_server.PostgresStorage()
+    await storage.open()
+    assert gift_server.relations_layout == 'symmetric'
+    data = {}
+    written, changed = [], []
+    for i, citizens in enumerate(imports):
+        import_id = await store(storage, citizens)
+        data[import_id] = await read(storage, import_id)
+        written.append(data[import_id])
+        if i < 2:
+            import_id = await store(storage, citizens)
+            await change(storage, i, import_id)
+            data[import_id] = await read(storage, import_id)
+            changed.append(data[import_id])
+    await storage.close()
+
+    for layout in LAYOUTS:
+
+        # conversion & restart
+        await convert(layout)
+        await storage.open()
+        try:
+            assert gift_server.relations_layout == layout
+            await check_rows(layout)
+            for import_id, import_data in data.items():
+                assert await read(storage, import_id) == import_data
+
+            # new & changed imports
+            for i, citizens in enumerate(imports):
+                import_id = await store(storage, citizens)
+                assert await read(storage, import_id) == written[i]
+                if i < 2:
+                    await change(storage, i, import_id)
+                    assert await read(storage, import_id) == changed[i]
+                data[import_id] = await read(storage, import_id)
+            await check_rows(layout)
+        finally:
+            await storage.close()
+
+    # failed symmetric -> compact conversion (one import is converted)
+    # may only be repeated
+    await bind_schema(SCHEMA)
+    await gift_server.write_setting('relations_layout_target', 'compact')
+    await gift_server.db.status('DELETE FROM relations '
+                                'WHERE import_id = $1 AND x > y', min(data))
+    await gift_server.db.pop_bind().close()
+    try:
+        await convert('array')
+        assert False
+    except RuntimeError:
+        await gift_server.db.pop_bind().close()
+    for layout in ('compact', 'array'):
+        await convert(layout)
+        await storage.open()
+        try:
+            await check_rows(layout)
+            for import_id, import_data in data.items():
+                assert await read(storage, import_id) == import_data
+        finally:
+            await storage.close()
+
+def test_f():
+    asyncio.run(run_in_schema(SCHEMA, run))
+
+
+if __name__ == '__main__':
+    test_f()